@@ -4,10 +4,20 @@ Simple YouTube Transcript MCP Server - Direct approach
 """
 
 import asyncio
-import json
 import logging
 import sys
 import os
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
 
 # Add src directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -15,7 +25,12 @@ src_dir = os.path.join(current_dir, 'src')
 sys.path.insert(0, src_dir)
 
 from youtube_transcript_mcp.transcript_tools import YouTubeTranscriptManager
-from youtube_transcript_mcp.utils import extract_video_id, format_transcript_output
+from youtube_transcript_mcp.utils import (
+    extract_video_id,
+    format_transcript_output,
+    json_dumps_bytes,
+    json_loads,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,108 +38,163 @@ logger = logging.getLogger(__name__)
 # Initialize the YouTube transcript manager
 transcript_manager = YouTubeTranscriptManager()
 
-class SimpleYouTubeTranscriptServer:
-    def __init__(self):
-        self.tools = [
-            {
-                "name": "extract_video_id",
-                "description": "Extract YouTube video ID from a URL or return the ID if already provided",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "url_or_id": {
-                            "type": "string",
-                            "description": "YouTube URL or video ID"
-                        }
-                    },
-                    "required": ["url_or_id"]
+# Output formats accepted by get_video_transcript
+TRANSCRIPT_FORMATS = ("json", "text", "srt", "vtt")
+DEFAULT_LANGUAGES = ("en",)
+
+class TranscriptArgs(NamedTuple):
+    """Decoded arguments of the get_video_transcript tool"""
+    video_id: str
+    languages: Sequence[str] = DEFAULT_LANGUAGES
+    format: str = "text"
+
+def parse_transcript_args(arguments: Dict[str, Any]) -> TranscriptArgs:
+    """Decode and validate get_video_transcript arguments into TranscriptArgs"""
+    video_id = arguments.get("video_id")
+    if not video_id:
+        raise ValueError("video_id is required")
+    if not isinstance(video_id, str):
+        raise ValueError("video_id must be a string")
+    
+    languages = arguments.get("languages", DEFAULT_LANGUAGES)
+    if not isinstance(languages, (list, tuple)) or not all(
+        isinstance(language, str) for language in languages
+    ):
+        raise ValueError("languages must be a list of strings")
+    
+    format_type = arguments.get("format", "text")
+    if format_type not in TRANSCRIPT_FORMATS:
+        raise ValueError(
+            f"format must be one of {', '.join(TRANSCRIPT_FORMATS)}, "
+            f"got {format_type!r}"
+        )
+    
+    return TranscriptArgs(video_id, languages, format_type)
+
+# A JSON-RPC response dict, pre-serialized JSON bytes, or None for notifications
+Response = Optional[Union[Dict[str, Any], bytes]]
+
+# Tool definitions returned by tools/list
+TOOLS = [
+    {
+        "name": "extract_video_id",
+        "description": "Extract YouTube video ID from a URL or return the ID if already provided",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "url_or_id": {
+                    "type": "string",
+                    "description": "YouTube URL or video ID"
                 }
             },
-            {
-                "name": "get_video_transcript",
-                "description": "Download transcript for a YouTube video",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "video_id": {
-                            "type": "string",
-                            "description": "YouTube video ID"
-                        },
-                        "languages": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of preferred language codes (e.g., ['en', 'zh-TW', 'es'])",
-                            "default": ["en"]
-                        },
-                        "format": {
-                            "type": "string",
-                            "enum": ["json", "text", "srt", "vtt"],
-                            "description": "Output format",
-                            "default": "text"
-                        }
-                    },
-                    "required": ["video_id"]
+            "required": ["url_or_id"]
+        }
+    },
+    {
+        "name": "get_video_transcript",
+        "description": "Download transcript for a YouTube video",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID"
+                },
+                "languages": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of preferred language codes (e.g., ['en', 'zh-TW', 'es'])",
+                    "default": ["en"]
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["json", "text", "srt", "vtt"],
+                    "description": "Output format",
+                    "default": "text"
                 }
-            }
-        ]
+            },
+            "required": ["video_id"]
+        }
+    }
+]
 
-    async def handle_request(self, request):
-        """Handle MCP request"""
-        method = request.get("method")
-        
-        # Handle notification requests (no id field)
-        if method == "notifications/initialized":
-            # Notifications don't need a response, just log and continue
-            logger.info("Received initialization notification")
-            return None
-        
-        if method == "initialize":
-            return {
-                "jsonrpc": "2.0",
-                "id": request["id"],
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {}
-                    },
-                    "serverInfo": {
-                        "name": "youtube-transcript-mcp",
-                        "version": "1.0.0"
-                    }
+# tools/list result, serialized once since the tool definitions never change
+TOOLS_LIST_RESULT_JSON = json_dumps_bytes({"tools": TOOLS})
+
+class SimpleYouTubeTranscriptServer:
+    def __init__(self) -> None:
+        self.tools = TOOLS
+        self._dispatch: Dict[
+            str, Callable[[Dict[str, Any]], Awaitable[Response]]
+        ] = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+            "notifications/initialized": self._handle_initialized_notification,
+        }
+
+    async def handle_request(self, request: Dict[str, Any]) -> Response:
+        """Handle MCP request, returning a response dict or pre-serialized JSON bytes"""
+        handler = self._dispatch.get(request.get("method", ""))
+        if handler is None:
+            return self._method_not_found(request)
+        return await handler(request)
+
+    async def _handle_initialized_notification(self, request: Dict[str, Any]) -> None:
+        """Handle the initialized notification (no id field)"""
+        # Notifications don't need a response, just log and continue
+        logger.info("Received initialization notification")
+        return None
+
+    async def _handle_initialize(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle the initialize request"""
+        return {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "result": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {
+                    "tools": {}
+                },
+                "serverInfo": {
+                    "name": "youtube-transcript-mcp",
+                    "version": "1.0.0"
                 }
             }
+        }
+
+    async def _handle_tools_list(self, request: Dict[str, Any]) -> bytes:
+        """Handle the tools/list request"""
+        # Already serialized: splice the request id into the cached result
+        return (
+            b'{"jsonrpc":"2.0","id":' + json_dumps_bytes(request["id"])
+            + b',"result":' + TOOLS_LIST_RESULT_JSON + b'}'
+        )
+
+    async def _handle_tools_call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle the tools/call request"""
+        params = request.get("params", {})
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
         
-        elif method == "tools/list":
-            return {
-                "jsonrpc": "2.0",
-                "id": request["id"],
-                "result": {
-                    "tools": self.tools
-                }
-            }
+        result = await self.call_tool(tool_name, arguments)
         
-        elif method == "tools/call":
-            params = request.get("params", {})
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
-            
-            result = await self.call_tool(tool_name, arguments)
-            
-            return {
-                "jsonrpc": "2.0",
-                "id": request["id"],
-                "result": result
-            }
-        
-        else:
-            return {
-                "jsonrpc": "2.0",
-                "id": request["id"],
-                "error": {
-                    "code": -32601,
-                    "message": "Method not found"
-                }
+        return {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "result": result
+        }
+
+    def _method_not_found(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the error response for an unknown method"""
+        return {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "error": {
+                "code": -32601,
+                "message": "Method not found"
             }
+        }
 
     async def call_tool(self, name, arguments):
         """Call a specific tool"""
@@ -151,22 +221,22 @@ class SimpleYouTubeTranscriptServer:
                 }
             
             elif name == "get_video_transcript":
-                video_id = arguments.get("video_id", "")
-                languages = arguments.get("languages", ["en"])
-                format_type = arguments.get("format", "text")
-                
-                if not video_id:
+                try:
+                    args = parse_transcript_args(arguments)
+                except ValueError as e:
                     return {
                         "content": [{
                             "type": "text",
-                            "text": "Error: video_id is required"
+                            "text": f"Error: {e}"
                         }],
                         "isError": True
                     }
                 
                 try:
-                    transcript = transcript_manager.get_transcript(video_id, languages)
-                    formatted_output = format_transcript_output(transcript, format_type)
+                    transcript = transcript_manager.get_transcript(
+                        args.video_id, args.languages
+                    )
+                    formatted_output = format_transcript_output(transcript, args.format)
                     
                     return {
                         "content": [{
@@ -203,6 +273,74 @@ class SimpleYouTubeTranscriptServer:
                 "isError": True
             }
 
+# Maximum size of a single JSON-RPC line read from stdin
+STDIN_LINE_LIMIT = 16 * 1024 * 1024
+
+async def stdin_lines() -> AsyncIterator[Optional[Union[str, bytes]]]:
+    """Yield lines from stdin until EOF, or None for a line over STDIN_LINE_LIMIT"""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=STDIN_LINE_LIMIT)
+    protocol = asyncio.StreamReaderProtocol(reader)
+    
+    # A pipe registered with the loop is made non-blocking, and a terminal is
+    # shared with stdout, so large writes could fail with BlockingIOError.
+    # On Windows the proactor loop accepts stdin as a pipe but every read
+    # then fails with OSError, so blocking reads are used there as well.
+    use_pipe = not sys.stdin.isatty() and sys.platform != "win32"
+    if use_pipe:
+        try:
+            await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+        except (NotImplementedError, OSError, ValueError):
+            # Not a pipe the loop can watch (e.g. a regular file)
+            use_pipe = False
+    
+    if not use_pipe:
+        # Fall back to blocking reads in the default executor
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                return
+            yield line
+    
+    skipping = False
+    while True:
+        try:
+            line = await reader.readuntil(b"\n")
+        except OSError as e:
+            # The pipe transport closes stdin on a read error, so there is
+            # nothing left to read from; treat it as EOF
+            logger.error("Error reading stdin: %s", e)
+            return
+        except asyncio.IncompleteReadError as e:
+            # EOF: the last line has no trailing newline
+            if skipping:
+                yield None
+            elif e.partial:
+                yield e.partial
+            return
+        except asyncio.LimitOverrunError as e:
+            # Drop what is buffered of the oversized line and keep reading
+            # until its end
+            await reader.readexactly(e.consumed)
+            skipping = True
+            continue
+        
+        if skipping:
+            # This is the tail of the oversized line
+            skipping = False
+            yield None
+        else:
+            yield line
+
+def write_message(message: Union[Dict[str, Any], bytes]) -> None:
+    """Write a JSON-RPC message (dict or pre-serialized JSON bytes) as one line"""
+    if not isinstance(message, bytes):
+        message = json_dumps_bytes(message)
+    out = sys.stdout.buffer
+    out.write(message)
+    out.write(b"\n")
+    out.flush()
+
 async def main():
     """Run the simple MCP server"""
     logger.info("=== STARTING SIMPLE YOUTUBE TRANSCRIPT MCP SERVER ===")
@@ -210,34 +348,34 @@ async def main():
     server = SimpleYouTubeTranscriptServer()
     
     # Read from stdin and write to stdout
-    while True:
+    async for line in stdin_lines():
+        request = None
         try:
-            line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
-            if not line:
-                break
+            if line is None:
+                raise ValueError(
+                    f"Request line exceeds the {STDIN_LINE_LIMIT} byte limit"
+                )
             
-            request = json.loads(line.strip())
+            request = json_loads(line)
             logger.info(f"Received request: {request.get('method')}")
             
             response = await server.handle_request(request)
             
             # Only write response if it's not None (notifications don't need responses)
             if response is not None:
-                print(json.dumps(response))
-                sys.stdout.flush()
+                write_message(response)
             
         except Exception as e:
             logger.error(f"Error processing request: {e}")
             error_response = {
                 "jsonrpc": "2.0",
-                "id": request.get("id") if 'request' in locals() else None,
+                "id": request.get("id") if isinstance(request, dict) else None,
                 "error": {
                     "code": -32603,
                     "message": str(e)
                 }
             }
-            print(json.dumps(error_response))
-            sys.stdout.flush()
+            write_message(error_response)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
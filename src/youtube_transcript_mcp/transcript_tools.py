@@ -5,11 +5,16 @@ This module provides tools for interacting with YouTube video transcripts
 using the youtube-transcript-api.
 """
 
+import asyncio
+import functools
 import logging
-from typing import List, Optional, Union
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.formatters import (
+    Formatter,
     JSONFormatter,
     TextFormatter,
     SRTFormatter,
@@ -18,19 +23,80 @@ from youtube_transcript_api.formatters import (
 
 logger = logging.getLogger(__name__)
 
+# Formatter classes by format type, instantiated on first use
+_FACTORY = {
+    'json': JSONFormatter,
+    'text': TextFormatter,
+    'srt': SRTFormatter,
+    'vtt': WebVTTFormatter,
+}
+
+# Default lifetime (seconds) and capacity of the fetched transcript cache
+DEFAULT_CACHE_TTL = 3600.0
+DEFAULT_CACHE_SIZE = 128
+
+
+class TranscriptError(Exception):
+    """
+    Raised when a transcript operation fails.
+    
+    The underlying error is chained as __cause__ and appended to the message
+    only when the exception is converted to a string.
+    """
+    
+    def __str__(self) -> str:
+        message = super().__str__()
+        if self.__cause__ is not None:
+            return f"{message}: {self.__cause__}"
+        return message
+
 
 class YouTubeTranscriptManager:
     """Manager class for YouTube transcript operations."""
     
-    def __init__(self):
-        """Initialize the YouTube transcript manager."""
+    # Formatter instances shared by all managers, keyed by format type
+    _FORMATTERS: Dict[str, Formatter] = {}
+    
+    def __init__(
+        self,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        """
+        Initialize the YouTube transcript manager.
+        
+        Args:
+            cache_ttl: Seconds a fetched transcript is reused (0 disables caching)
+            cache_size: Maximum number of fetched transcripts kept in memory
+        """
         self.api = YouTubeTranscriptApi()
-        self.formatters = {
-            'json': JSONFormatter(),
-            'text': TextFormatter(),
-            'srt': SRTFormatter(),
-            'vtt': WebVTTFormatter(),
-        }
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # (video_id, languages, preserve_formatting) -> (fetch time, transcript)
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        # get_transcripts calls get_transcript from executor threads
+        self._cache_lock = threading.Lock()
+    
+    @classmethod
+    def get_formatter(cls, format_type: str) -> Formatter:
+        """
+        Get the shared formatter instance for a format type.
+        
+        Args:
+            format_type: Format type ('json', 'text', 'srt', 'vtt')
+            
+        Returns:
+            Formatter instance
+            
+        Raises:
+            ValueError: If format_type is not supported
+        """
+        formatter = cls._FORMATTERS.get(format_type)
+        if formatter is None:
+            if format_type not in _FACTORY:
+                raise ValueError(f"Unsupported format type: {format_type}")
+            formatter = cls._FORMATTERS.setdefault(format_type, _FACTORY[format_type]())
+        return formatter
     
     def list_transcripts(self, video_id: str):
         """
@@ -43,17 +109,17 @@ class YouTubeTranscriptManager:
             TranscriptList object containing available transcripts
             
         Raises:
-            Exception: If transcripts cannot be retrieved
+            TranscriptError: If transcripts cannot be retrieved
         """
         try:
             transcript_list = self.api.list(video_id)
-            # Count transcripts manually since TranscriptList doesn't have len()
-            transcript_count = sum(1 for _ in transcript_list)
-            logger.info(f"Found {transcript_count} transcripts for video {video_id}")
+            logger.info("Listed transcripts for video %s", video_id)
             return transcript_list
         except Exception as e:
-            logger.error(f"Error listing transcripts for {video_id}: {str(e)}")
-            raise Exception(f"Could not list transcripts for video {video_id}: {str(e)}")
+            logger.exception("Error listing transcripts for %s", video_id)
+            raise TranscriptError(
+                f"Could not list transcripts for video {video_id}"
+            ) from e
     
     def get_transcript(
         self, 
@@ -73,11 +139,17 @@ class YouTubeTranscriptManager:
             FetchedTranscript object
             
         Raises:
-            Exception: If transcript cannot be retrieved
+            TranscriptError: If transcript cannot be retrieved
         """
         if languages is None:
             languages = ['en']
         
+        key = (video_id, tuple(languages), preserve_formatting)
+        cached = self._get_cached(key)
+        if cached is not None:
+            logger.info("Using cached transcript for video %s", video_id)
+            return cached
+        
         try:
             transcript = self.api.fetch(
                 video_id, 
@@ -85,10 +157,74 @@ class YouTubeTranscriptManager:
                 preserve_formatting=preserve_formatting
             )
             logger.info(f"Retrieved transcript for video {video_id} in language {transcript.language}")
-            return transcript
         except Exception as e:
-            logger.error(f"Error getting transcript for {video_id}: {str(e)}")
-            raise Exception(f"Could not get transcript for video {video_id}: {str(e)}")
+            logger.exception("Error getting transcript for %s", video_id)
+            raise TranscriptError(
+                f"Could not get transcript for video {video_id}"
+            ) from e
+        
+        self._put_cached(key, transcript)
+        return transcript
+    
+    async def get_transcripts(
+        self,
+        video_ids: List[str],
+        languages: Optional[List[str]] = None,
+        concurrency: int = 8
+    ) -> List[Any]:
+        """
+        Get transcripts for several videos concurrently.
+        
+        Each fetch runs in the default executor, with at most `concurrency`
+        fetches in flight at once.
+        
+        Args:
+            video_ids: YouTube video IDs
+            languages: List of preferred language codes (e.g., ['en', 'zh-TW'])
+            concurrency: Maximum number of simultaneous fetches
+            
+        Returns:
+            List with a FetchedTranscript object, or the exception raised while
+            fetching it, for each video ID in order
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(video_id: str) -> Any:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    None, functools.partial(self.get_transcript, video_id, languages)
+                )
+        
+        return await asyncio.gather(
+            *(fetch_one(video_id) for video_id in video_ids),
+            return_exceptions=True
+        )
+    
+    def _get_cached(self, key: Tuple) -> Any:
+        """Return a cached transcript for key, or None if missing or expired."""
+        with self._cache_lock:
+            entry = self._cache.pop(key, None)
+            if entry is None:
+                return None
+            
+            fetched_at, transcript = entry
+            if time.monotonic() - fetched_at >= self.cache_ttl:
+                return None
+            
+            # Re-insert so the most recently used entries are evicted last
+            self._cache[key] = entry
+            return transcript
+    
+    def _put_cached(self, key: Tuple, transcript: Any) -> None:
+        """Store a fetched transcript, evicting the least recently used entry."""
+        if self.cache_ttl <= 0 or self.cache_size <= 0:
+            return
+        
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), transcript)
+            while len(self._cache) > self.cache_size:
+                self._cache.pop(next(iter(self._cache)))
     
     def translate_transcript(
         self,
@@ -108,7 +244,7 @@ class YouTubeTranscriptManager:
             FetchedTranscript object with translated content
             
         Raises:
-            Exception: If transcript cannot be translated
+            TranscriptError: If transcript cannot be translated
         """
         try:
             # Get the transcript list
@@ -124,7 +260,10 @@ class YouTubeTranscriptManager:
                         break
                 
                 if transcript is None:
-                    raise Exception("No translatable transcripts found")
+                    logger.error("No translatable transcripts found for %s", video_id)
+                    raise TranscriptError(
+                        f"No translatable transcripts found for video {video_id}"
+                    )
             else:
                 transcript = transcript_list.find_transcript([source_language])
             
@@ -137,9 +276,13 @@ class YouTubeTranscriptManager:
             logger.info(f"Translated transcript for video {video_id} from {transcript.language} to {target_language}")
             return result
             
+        except TranscriptError:
+            raise
         except Exception as e:
-            logger.error(f"Error translating transcript for {video_id}: {str(e)}")
-            raise Exception(f"Could not translate transcript for video {video_id}: {str(e)}")
+            logger.exception("Error translating transcript for %s", video_id)
+            raise TranscriptError(
+                f"Could not translate transcript for video {video_id}"
+            ) from e
     
     def format_transcript(self, transcript, format_type: str = "json", **kwargs):
         """
@@ -156,10 +299,7 @@ class YouTubeTranscriptManager:
         Raises:
             ValueError: If format_type is not supported
         """
-        if format_type not in self.formatters:
-            raise ValueError(f"Unsupported format type: {format_type}")
-        
-        formatter = self.formatters[format_type]
+        formatter = self.get_formatter(format_type)
         return formatter.format_transcript(transcript, **kwargs)
     
     def get_video_info(self, video_id: str) -> dict:
@@ -171,13 +311,16 @@ class YouTubeTranscriptManager:
             
         Returns:
             Dictionary containing video transcript information
+            
+        Raises:
+            TranscriptError: If transcript information cannot be retrieved
         """
         try:
             transcript_list = self.list_transcripts(video_id)
             
-            info = {
+            info: Dict[str, Any] = {
                 "video_id": video_id,
-                "total_transcripts": len(transcript_list),
+                "total_transcripts": 0,
                 "available_languages": [],
                 "manually_created": [],
                 "auto_generated": [],
@@ -202,8 +345,11 @@ class YouTubeTranscriptManager:
                 if transcript.is_translatable:
                     info["translatable"].append(lang_info)
             
+            info["total_transcripts"] = len(info["available_languages"])
             return info
             
+        except TranscriptError:
+            raise
         except Exception as e:
-            logger.error(f"Error getting video info for {video_id}: {str(e)}")
-            raise Exception(f"Could not get video info for {video_id}: {str(e)}")
\ No newline at end of file
+            logger.exception("Error getting video info for %s", video_id)
+            raise TranscriptError(f"Could not get video info for {video_id}") from e
\ No newline at end of file
@@ -2,12 +2,98 @@
 Utility functions for the YouTube Transcript MCP Server.
 """
 
+import importlib.util
 import json
 import re
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
 from urllib.parse import parse_qs, urlparse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
 
+# NumPy is an optional speedup. It is only imported once a long transcript
+# is formatted, since importing it noticeably slows down server startup.
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# Bare 11-character YouTube video ID
+_BARE_ID = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+
+# Standard watch URLs (including playlist URLs with extra query parameters),
+# youtu.be short URLs and embed URLs, with the video ID captured once
+_URL_ID = re.compile(
+    r'(?:youtu\.be/|youtube\.com/(?:watch\?(?:.*&)?v=|embed/))([a-zA-Z0-9_-]{11})'
+)
+
+# Language code such as "en" or "zh-TW"
+_LANGUAGE_CODE = re.compile(r'^[a-zA-Z]{2,3}(-[a-zA-Z]{2,4})?$')
+
+# Characters that are invalid in filenames, mapped to underscores
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Transcripts with at least this many snippets format timestamps with NumPy,
+# this many snippets at a time
+_NUMPY_MIN_SNIPPETS = 256
+_NUMPY_BATCH_SIZE = 1024
+
+
+class TranscriptSnippet(Protocol):
+    """A single timed line of a transcript (e.g. FetchedTranscriptSnippet)."""
+    
+    text: str
+    start: float
+    duration: float
+
+
+class Transcript(Protocol):
+    """A fetched transcript with its metadata (e.g. FetchedTranscript)."""
+    
+    video_id: str
+    language: str
+    language_code: str
+    is_generated: bool
+    
+    def __iter__(self) -> Iterator[TranscriptSnippet]: ...
+    
+    def __len__(self) -> int: ...
+
+
+if orjson is not None:
+    def json_dumps(obj: Any, pretty: bool = False) -> str:
+        """Serialize obj to a JSON string, indented by 2 spaces if pretty."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 encoded JSON."""
+        return orjson.dumps(obj)
+
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj: Any, pretty: bool = False) -> str:
+        """Serialize obj to a JSON string, indented by 2 spaces if pretty."""
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj, ensure_ascii=False)
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 encoded JSON."""
+        return json.dumps(obj, ensure_ascii=False).encode()
+
+    json_loads = json.loads
+
+
+@lru_cache(maxsize=4096)
 def extract_video_id(url_or_id: str) -> Optional[str]:
     """
     Extract YouTube video ID from a URL or return the ID if already provided.
@@ -30,25 +116,12 @@ def extract_video_id(url_or_id: str) -> Optional[str]:
         return None
     
     # If it's already just a video ID (11 characters, alphanumeric + underscore + hyphen)
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', url_or_id):
+    if _BARE_ID.match(url_or_id):
         return url_or_id
     
-    # Parse different YouTube URL formats
-    patterns = [
-        # Standard YouTube URLs
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        # YouTube short URLs
-        r'(?:https?://)?youtu\.be/([a-zA-Z0-9_-]{11})',
-        # YouTube embed URLs
-        r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        # YouTube playlist URLs with video
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?.*v=([a-zA-Z0-9_-]{11})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url_or_id)
-        if match:
-            return match.group(1)
+    match = _URL_ID.search(url_or_id)
+    if match:
+        return match.group(1)
     
     return None
 
@@ -71,14 +144,17 @@ def validate_language_code(language_code: str) -> bool:
         >>> validate_language_code("invalid")
         False
     """
-    if not language_code:
+    # Cheap checks first: valid codes are 2-8 ASCII characters, plus the
+    # trailing newline that "$" in the pattern also accepts
+    if not language_code or not (2 <= len(language_code) <= 9):
+        return False
+    if not language_code.isascii():
         return False
     
-    # Accept common language codes (2-5 characters, letters, numbers, hyphens)
-    return bool(re.match(r'^[a-zA-Z]{2,3}(-[a-zA-Z]{2,4})?$', language_code))
+    return _LANGUAGE_CODE.match(language_code) is not None
 
 
-def format_transcript_output(transcript, format_type: str) -> str:
+def format_transcript_output(transcript: Transcript, format_type: str) -> str:
     """
     Format a transcript for output.
     
@@ -89,62 +165,174 @@ def format_transcript_output(transcript, format_type: str) -> str:
     Returns:
         Formatted transcript string
     """
-    if format_type == "json":
-        # Convert transcript to JSON format
-        data = {
-            "video_id": transcript.video_id,
-            "language": transcript.language,
-            "language_code": transcript.language_code,
-            "is_generated": transcript.is_generated,
-            "transcript": []
-        }
+    return "".join(iter_format_transcript_output(transcript, format_type))
+
+
+def iter_format_transcript_output(
+    transcript: Transcript, format_type: str
+) -> Iterator[str]:
+    """
+    Format a transcript for output as a stream of chunks.
+    
+    Joining the chunks gives the same string as format_transcript_output.
+    Text, SRT and WebVTT output is produced one snippet at a time, so the
+    formatted output does not have to be held in memory at once. JSON output
+    is a single chunk. For long transcripts with NumPy installed, SRT and
+    WebVTT timestamps are formatted a batch of snippets at a time.
+    
+    Args:
+        transcript: FetchedTranscript object
+        format_type: Output format ('json', 'text', 'srt', 'vtt')
+        
+    Returns:
+        Iterator over formatted chunks
         
-        for snippet in transcript:
-            data["transcript"].append({
+    Raises:
+        ValueError: If format_type is not supported
+    """
+    formatter = _FORMATTERS.get(format_type)
+    if formatter is None:
+        raise ValueError(f"Unsupported format type: {format_type}")
+    
+    return formatter(transcript)
+
+
+def _iter_json(transcript: Transcript) -> Iterator[str]:
+    """Format a transcript as indented JSON, including its metadata."""
+    data = {
+        "video_id": transcript.video_id,
+        "language": transcript.language,
+        "language_code": transcript.language_code,
+        "is_generated": transcript.is_generated,
+        "transcript": [
+            {
                 "text": snippet.text,
                 "start": snippet.start,
                 "duration": snippet.duration
-            })
-        
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    
-    elif format_type == "text":
-        # Simple text format with timestamps
-        lines = []
-        for snippet in transcript:
-            lines.append(f"[{snippet.start:.2f}s] {snippet.text}")
-        return "\n".join(lines)
-    
-    elif format_type == "srt":
-        # SRT subtitle format
-        lines = []
-        for i, snippet in enumerate(transcript, 1):
-            start_time = seconds_to_srt_time(snippet.start)
-            end_time = seconds_to_srt_time(snippet.start + snippet.duration)
-            
-            lines.append(f"{i}")
-            lines.append(f"{start_time} --> {end_time}")
-            lines.append(snippet.text)
-            lines.append("")  # Empty line between entries
-        
-        return "\n".join(lines)
+            }
+            for snippet in transcript
+        ]
+    }
     
-    elif format_type == "vtt":
-        # WebVTT subtitle format
-        lines = ["WEBVTT", ""]
+    yield json_dumps(data, pretty=True)
+
+
+def _iter_text(transcript: Transcript) -> Iterator[str]:
+    """Format a transcript as plain text lines prefixed with their start time."""
+    separator = ""
+    for snippet in transcript:
+        yield f"{separator}[{snippet.start:.2f}s] {snippet.text}"
+        separator = "\n"
+
+
+def _iter_srt(transcript: Transcript) -> Iterator[str]:
+    """Format a transcript as SRT, with an empty line between entries."""
+    separator = ""
+    for i, (start_time, end_time, text) in enumerate(
+        _iter_cues(transcript, ",", seconds_to_srt_time), 1
+    ):
+        yield f"{separator}{i}\n{start_time} --> {end_time}\n{text}\n"
+        separator = "\n"
+
+
+def _iter_vtt(transcript: Transcript) -> Iterator[str]:
+    """Format a transcript as WebVTT, with an empty line between entries."""
+    yield "WEBVTT\n"
+    for start_time, end_time, text in _iter_cues(
+        transcript, ".", seconds_to_vtt_time
+    ):
+        yield f"\n{start_time} --> {end_time}\n{text}\n"
+
+
+# Chunk generators used by iter_format_transcript_output, by format type
+_FORMATTERS = {
+    "json": _iter_json,
+    "text": _iter_text,
+    "srt": _iter_srt,
+    "vtt": _iter_vtt,
+}
+
+
+def _iter_cues(
+    transcript: Transcript,
+    ms_separator: str,
+    to_time: Callable[[float], str]
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (start time, end time, text) for each snippet of a transcript.
+    
+    Times are formatted as HH:MM:SS followed by milliseconds. For long
+    transcripts, when NumPy is installed, times are formatted with vectorized
+    arithmetic a batch of snippets at a time; otherwise each value goes
+    through to_time.
+    
+    Args:
+        transcript: FetchedTranscript object
+        ms_separator: Separator before the milliseconds ("," for SRT, "." for WebVTT)
+        to_time: Scalar formatter producing the same output for one value
+    """
+    if _HAS_NUMPY and len(transcript) >= _NUMPY_MIN_SNIPPETS:
+        import numpy
         
-        for snippet in transcript:
-            start_time = seconds_to_vtt_time(snippet.start)
-            end_time = seconds_to_vtt_time(snippet.start + snippet.duration)
-            
-            lines.append(f"{start_time} --> {end_time}")
-            lines.append(snippet.text)
-            lines.append("")  # Empty line between entries
+        snippets = iter(transcript)
+        while True:
+            batch = list(islice(snippets, _NUMPY_BATCH_SIZE))
+            if not batch:
+                return
+            count = len(batch)
+            starts = numpy.fromiter(
+                (snippet.start for snippet in batch), numpy.float64, count
+            )
+            ends = starts + numpy.fromiter(
+                (snippet.duration for snippet in batch), numpy.float64, count
+            )
+            yield from zip(
+                _format_timestamps(starts, ms_separator),
+                _format_timestamps(ends, ms_separator),
+                (snippet.text for snippet in batch),
+            )
+    
+    for snippet in transcript:
+        start = snippet.start
+        yield to_time(start), to_time(start + snippet.duration), snippet.text
+
+
+def _format_timestamps(seconds: Any, ms_separator: str) -> List[str]:
+    """
+    Format a NumPy array of times as HH:MM:SS followed by milliseconds.
+    
+    Whole seconds and milliseconds are split out with vectorized arithmetic,
+    and HH:MM:SS comes from the precomputed table.
+    
+    Args:
+        seconds: NumPy float64 array of times in seconds
+        ms_separator: Separator before the milliseconds
         
-        return "\n".join(lines)
+    Returns:
+        Formatted times, in order
+    """
+    import numpy
     
-    else:
-        raise ValueError(f"Unsupported format type: {format_type}")
+    whole = seconds.astype(numpy.int64)
+    millisecs = ((seconds - whole) * 1000).astype(numpy.int64)
+    
+    return [
+        f"{_HMS[w] if 0 <= w < _HMS_SIZE else _format_hms(w)}{ms_separator}{ms:03d}"
+        for w, ms in zip(whole.tolist(), millisecs.tolist())
+    ]
+
+
+def _format_hms(whole_seconds: int) -> str:
+    """Format whole seconds as HH:MM:SS."""
+    hours, rem = divmod(whole_seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+# HH:MM:SS strings for every whole second of the first three hours, which
+# covers nearly all videos; later times are formatted on demand
+_HMS_SIZE = 3 * 3600 + 1
+_HMS = [_format_hms(i) for i in range(_HMS_SIZE)]
 
 
 def seconds_to_srt_time(seconds: float) -> str:
@@ -157,12 +345,11 @@ def seconds_to_srt_time(seconds: float) -> str:
     Returns:
         Time in SRT format
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
+    whole = int(seconds)
+    millisecs = int((seconds - whole) * 1000)
+    hms = _HMS[whole] if 0 <= whole < _HMS_SIZE else _format_hms(whole)
     
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+    return f"{hms},{millisecs:03d}"
 
 
 def seconds_to_vtt_time(seconds: float) -> str:
@@ -175,12 +362,11 @@ def seconds_to_vtt_time(seconds: float) -> str:
     Returns:
         Time in WebVTT format
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
+    whole = int(seconds)
+    millisecs = int((seconds - whole) * 1000)
+    hms = _HMS[whole] if 0 <= whole < _HMS_SIZE else _format_hms(whole)
     
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millisecs:03d}"
+    return f"{hms}.{millisecs:03d}"
 
 
 def get_file_extension(format_type: str) -> str:
@@ -213,11 +399,6 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Replace invalid characters with underscores
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '_', filename)
-    
-    # Remove leading/trailing spaces and dots
-    sanitized = sanitized.strip(' .')
-    
-    return sanitized
\ No newline at end of file
+    # Replace invalid characters with underscores, then remove
+    # leading/trailing spaces and dots
+    return filename.translate(_SANITIZE_TABLE).strip(' .')
\ No newline at end of file
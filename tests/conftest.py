@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration.
+"""
+
+import os
+import sys
+
+# Make the package (src layout) and simple_server importable without installing
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+sys.path.insert(0, ROOT_DIR)
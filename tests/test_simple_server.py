@@ -0,0 +1,144 @@
+"""
+Tests for simple_server.
+"""
+
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+import simple_server
+
+
+def run_with_stdin(monkeypatch, data, coroutine_function):
+    """Run coroutine_function() with data fed to sys.stdin through a real pipe."""
+    read_fd, write_fd = os.pipe()
+    stdin = os.fdopen(read_fd, "r")
+    monkeypatch.setattr(simple_server.sys, "stdin", stdin)
+
+    def feed():
+        with os.fdopen(write_fd, "wb") as pipe:
+            pipe.write(data)
+
+    writer = threading.Thread(target=feed)
+    writer.start()
+    try:
+        return asyncio.run(coroutine_function())
+    finally:
+        writer.join()
+        stdin.close()
+
+
+def read_stdin_lines(monkeypatch, data):
+    async def collect():
+        return [line async for line in simple_server.stdin_lines()]
+
+    return run_with_stdin(monkeypatch, data, collect)
+
+
+def test_stdin_lines_skips_oversized_line(monkeypatch):
+    monkeypatch.setattr(simple_server, "STDIN_LINE_LIMIT", 64)
+
+    lines = read_stdin_lines(
+        monkeypatch, b'{"id": 1}\n' + b"x" * 200 + b'\n{"id": 2}\n'
+    )
+
+    assert lines == [b'{"id": 1}\n', None, b'{"id": 2}\n']
+
+
+def test_stdin_lines_oversized_last_line_without_newline(monkeypatch):
+    monkeypatch.setattr(simple_server, "STDIN_LINE_LIMIT", 64)
+
+    lines = read_stdin_lines(monkeypatch, b'{"id": 1}\n' + b"x" * 200)
+
+    assert lines == [b'{"id": 1}\n', None]
+
+
+def test_stdin_lines_last_line_without_newline(monkeypatch):
+    lines = read_stdin_lines(monkeypatch, b'{"id": 1}\n{"id": 2}')
+
+    assert lines == [b'{"id": 1}\n', b'{"id": 2}']
+
+
+def test_stdin_lines_uses_blocking_reads_on_windows(monkeypatch):
+    monkeypatch.setattr(simple_server.sys, "platform", "win32")
+
+    lines = read_stdin_lines(monkeypatch, b'{"id": 1}\n{"id": 2}\n')
+
+    assert lines == ['{"id": 1}\n', '{"id": 2}\n']
+
+
+def test_stdin_lines_stops_on_read_error(monkeypatch):
+    async def readuntil(self, separator=b"\n"):
+        raise OSError("read failed")
+
+    monkeypatch.setattr(asyncio.StreamReader, "readuntil", readuntil)
+
+    assert read_stdin_lines(monkeypatch, b'{"id": 1}\n') == []
+
+
+def test_main_answers_oversized_line_with_error(monkeypatch, capsys):
+    monkeypatch.setattr(simple_server, "STDIN_LINE_LIMIT", 64)
+    request = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+    run_with_stdin(
+        monkeypatch,
+        b"x" * 200 + b"\n" + json.dumps(request).encode() + b"\n",
+        simple_server.main,
+    )
+
+    error, response = map(json.loads, capsys.readouterr().out.splitlines())
+    assert error["id"] is None
+    assert error["error"]["message"] == "Request line exceeds the 64 byte limit"
+    assert response["id"] == 2
+    assert "result" in response
+
+
+@pytest.mark.parametrize("request_id", [7, "req-1", 'quote " and \u00e9', None])
+def test_tools_list_splices_request_id(request_id):
+    server = simple_server.SimpleYouTubeTranscriptServer()
+
+    response = asyncio.run(server.handle_request(
+        {"jsonrpc": "2.0", "id": request_id, "method": "tools/list"}
+    ))
+
+    assert json.loads(response) == {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {"tools": simple_server.TOOLS},
+    }
+
+
+def test_parse_transcript_args_defaults():
+    args = simple_server.parse_transcript_args({"video_id": "dQw4w9WgXcQ"})
+
+    assert args.video_id == "dQw4w9WgXcQ"
+    assert args.languages == simple_server.DEFAULT_LANGUAGES
+    assert args.format == "text"
+
+
+def test_parse_transcript_args_explicit():
+    args = simple_server.parse_transcript_args({
+        "video_id": "dQw4w9WgXcQ",
+        "languages": ["zh-TW", "en"],
+        "format": "srt",
+    })
+
+    assert args.languages == ["zh-TW", "en"]
+    assert args.format == "srt"
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({}, "video_id is required"),
+    ({"video_id": ""}, "video_id is required"),
+    ({"video_id": 123}, "video_id must be a string"),
+    ({"video_id": "x", "languages": "en"}, "languages must be a list of strings"),
+    ({"video_id": "x", "languages": ["en", 1]}, "languages must be a list of strings"),
+    ({"video_id": "x", "format": "pdf"}, "format must be one of"),
+    ({"video_id": "x", "format": None}, "format must be one of"),
+])
+def test_parse_transcript_args_rejects(arguments, message):
+    with pytest.raises(ValueError, match=message):
+        simple_server.parse_transcript_args(arguments)
@@ -0,0 +1,225 @@
+"""
+Tests for youtube_transcript_mcp.transcript_tools.
+"""
+
+import asyncio
+
+import pytest
+
+from youtube_transcript_mcp import transcript_tools
+from youtube_transcript_mcp.transcript_tools import (
+    TranscriptError,
+    YouTubeTranscriptManager,
+)
+
+
+class FakeTranscript:
+    language = "English"
+
+    def __init__(self, video_id):
+        self.video_id = video_id
+
+
+class FakeFetch:
+    """Stand-in for YouTubeTranscriptApi.fetch that records its calls."""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def __call__(self, video_id, languages, preserve_formatting):
+        self.calls.append(video_id)
+        if self.error is not None:
+            raise self.error
+        return FakeTranscript(video_id)
+
+
+class FakeListedTranscript:
+    def __init__(self, language_code, is_generated=False, is_translatable=True):
+        self.language = language_code.upper()
+        self.language_code = language_code
+        self.is_generated = is_generated
+        self.is_translatable = is_translatable
+
+
+class FakeTranscriptList:
+    """Stand-in for TranscriptList, which can be iterated but has no len()."""
+
+    def __init__(self, *transcripts):
+        self.transcripts = transcripts
+
+    def __iter__(self):
+        return iter(self.transcripts)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic in transcript_tools."""
+    now = [1000.0]
+    monkeypatch.setattr(transcript_tools.time, "monotonic", lambda: now[0])
+    return now
+
+
+def make_manager(fetch, **kwargs):
+    manager = YouTubeTranscriptManager(**kwargs)
+    manager.api.fetch = fetch
+    return manager
+
+
+def test_cache_hit():
+    fetch = FakeFetch()
+    manager = make_manager(fetch)
+
+    first = manager.get_transcript("a", ["en"])
+    second = manager.get_transcript("a", ["en"])
+
+    assert second is first
+    assert fetch.calls == ["a"]
+
+
+def test_cache_key_includes_languages():
+    fetch = FakeFetch()
+    manager = make_manager(fetch)
+
+    manager.get_transcript("a", ["en"])
+    manager.get_transcript("a", ["de", "en"])
+
+    assert fetch.calls == ["a", "a"]
+
+
+def test_cache_expiry(clock):
+    fetch = FakeFetch()
+    manager = make_manager(fetch, cache_ttl=60)
+
+    manager.get_transcript("a")
+    clock[0] += 59
+    manager.get_transcript("a")
+    assert fetch.calls == ["a"]
+
+    clock[0] += 1
+    manager.get_transcript("a")
+    assert fetch.calls == ["a", "a"]
+
+
+def test_cache_evicts_least_recently_used():
+    fetch = FakeFetch()
+    manager = make_manager(fetch, cache_size=2)
+
+    manager.get_transcript("a")
+    manager.get_transcript("b")
+    manager.get_transcript("a")  # hit: "b" is now least recently used
+    manager.get_transcript("c")  # evicts "b"
+    manager.get_transcript("a")
+    manager.get_transcript("b")
+
+    assert fetch.calls == ["a", "b", "c", "b"]
+
+
+def test_cache_disabled():
+    fetch = FakeFetch()
+    manager = make_manager(fetch, cache_ttl=0)
+
+    manager.get_transcript("a")
+    manager.get_transcript("a")
+
+    assert fetch.calls == ["a", "a"]
+
+
+def test_fetch_error_is_not_cached():
+    fetch = FakeFetch(error=RuntimeError("network down"))
+    manager = make_manager(fetch)
+
+    for _ in range(2):
+        with pytest.raises(TranscriptError):
+            manager.get_transcript("a")
+
+    assert fetch.calls == ["a", "a"]
+
+
+def test_get_transcripts_returns_results_in_order():
+    fetch = FakeFetch()
+    manager = make_manager(fetch, cache_size=2)
+    video_ids = [str(i) for i in range(200)]
+
+    for _ in range(5):
+        results = asyncio.run(manager.get_transcripts(video_ids, concurrency=64))
+        assert [result.video_id for result in results] == video_ids
+
+
+def test_get_transcripts_returns_errors_in_place():
+    fetch = FakeFetch(error=RuntimeError("network down"))
+    manager = make_manager(fetch)
+
+    results = asyncio.run(manager.get_transcripts(["a", "b"]))
+
+    assert [type(result) for result in results] == [TranscriptError, TranscriptError]
+
+
+def test_get_video_info_counts_transcripts():
+    manager = YouTubeTranscriptManager()
+    manager.api.list = lambda video_id: FakeTranscriptList(
+        FakeListedTranscript("en"),
+        FakeListedTranscript("en", is_generated=True),
+        FakeListedTranscript("de", is_translatable=False),
+    )
+
+    info = manager.get_video_info("a")
+
+    assert info["total_transcripts"] == 3
+    assert len(info["available_languages"]) == 3
+    assert len(info["manually_created"]) == 2
+    assert len(info["auto_generated"]) == 1
+    assert len(info["translatable"]) == 2
+
+
+def test_get_video_info_without_transcripts():
+    manager = YouTubeTranscriptManager()
+    manager.api.list = lambda video_id: FakeTranscriptList()
+
+    info = manager.get_video_info("a")
+
+    assert info["total_transcripts"] == 0
+    assert info["available_languages"] == []
+
+
+def test_fetch_error_is_chained():
+    error = RuntimeError("network down")
+    manager = make_manager(FakeFetch(error=error))
+
+    with pytest.raises(TranscriptError) as excinfo:
+        manager.get_transcript("a")
+
+    assert excinfo.value.__cause__ is error
+    assert str(excinfo.value) == "Could not get transcript for video a: network down"
+
+
+def failing_list(video_id):
+    raise RuntimeError("network down")
+
+
+@pytest.mark.parametrize("method, args", [
+    ("translate_transcript", ("a", "auto", "de")),
+    ("get_video_info", ("a",)),
+])
+def test_list_error_passes_through_unchanged(method, args):
+    manager = YouTubeTranscriptManager()
+    manager.api.list = failing_list
+
+    with pytest.raises(TranscriptError) as excinfo:
+        getattr(manager, method)(*args)
+
+    assert isinstance(excinfo.value.__cause__, RuntimeError)
+    assert str(excinfo.value) == "Could not list transcripts for video a: network down"
+
+
+def test_translate_transcript_without_translatable_transcripts():
+    manager = YouTubeTranscriptManager()
+    manager.api.list = lambda video_id: FakeTranscriptList(
+        FakeListedTranscript("en", is_translatable=False),
+    )
+
+    with pytest.raises(TranscriptError) as excinfo:
+        manager.translate_transcript("a", "auto", "de")
+
+    assert excinfo.value.__cause__ is None
+    assert str(excinfo.value) == "No translatable transcripts found for video a"
@@ -0,0 +1,252 @@
+"""
+Tests for youtube_transcript_mcp.utils.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from youtube_transcript_mcp import utils
+from youtube_transcript_mcp.utils import (
+    extract_video_id,
+    format_transcript_output,
+    iter_format_transcript_output,
+    sanitize_filename,
+    seconds_to_srt_time,
+    seconds_to_vtt_time,
+    validate_language_code,
+)
+
+
+@dataclass
+class Snippet:
+    text: str
+    start: float
+    duration: float
+
+
+@dataclass
+class Transcript:
+    snippets: List[Snippet] = field(default_factory=list)
+    video_id: str = "dQw4w9WgXcQ"
+    language: str = "English"
+    language_code: str = "en"
+    is_generated: bool = False
+
+    def __iter__(self):
+        return iter(self.snippets)
+
+    def __len__(self):
+        return len(self.snippets)
+
+
+def make_transcript(count: int) -> Transcript:
+    return Transcript([
+        Snippet(f"line {i}", i * 2.5, 1.25 + (i % 4) * 0.25)
+        for i in range(count)
+    ])
+
+
+@pytest.mark.parametrize("url_or_id", [
+    "dQw4w9WgXcQ",
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "http://youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+    "https://www.youtube.com/watch?list=PL1234&v=dQw4w9WgXcQ&index=2",
+    "https://www.youtube.com/embed/dQw4w9WgXcQ",
+    "https://youtube.com/embed/dQw4w9WgXcQ?start=10",
+    "https://youtu.be/dQw4w9WgXcQ",
+    "youtu.be/dQw4w9WgXcQ?t=5",
+])
+def test_extract_video_id(url_or_id):
+    assert extract_video_id(url_or_id) == "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("url_or_id", [
+    "",
+    "tooshort",
+    "https://www.youtube.com/watch?list=PL1234",
+    "https://example.com/watch?v=dQw4w9WgXcQ",
+])
+def test_extract_video_id_invalid(url_or_id):
+    assert extract_video_id(url_or_id) is None
+
+
+def re_sanitize_filename(filename):
+    """sanitize_filename as implemented with re.sub before the translate table."""
+    return re.sub(r'[<>:"/\\|?*]', '_', filename).strip(' .')
+
+
+@pytest.mark.parametrize("filename", [
+    "",
+    "transcript.txt",
+    'a<b>c:d"e/f\\g|h?i*j',
+    "  .hidden name. ",
+    "...",
+    "<>:\"/\\|?*",
+    " ?leading and trailing* ",
+    "caf\u00e9 \u65e5\u672c\u8a9e/\u5b57\u5e55.srt",
+    "tab\tnew\nline",
+    "".join(map(chr, range(1, 0x800))),
+])
+def test_sanitize_filename_matches_re_sub(filename):
+    assert sanitize_filename(filename) == re_sanitize_filename(filename)
+
+
+def test_sanitize_filename():
+    assert sanitize_filename(' Who/What? "Why". ') == "Who_What_ _Why_"
+
+
+def re_validate_language_code(language_code):
+    """validate_language_code as implemented before the length checks."""
+    if not language_code:
+        return False
+    return bool(re.match(r'^[a-zA-Z]{2,3}(-[a-zA-Z]{2,4})?$', language_code))
+
+
+@pytest.mark.parametrize("language_code", [
+    "",
+    "e",
+    "en",
+    "EN",
+    "eng",
+    "zh-TW",
+    "zh-Hant",
+    "zho-Hant",
+    "zho-Hants",
+    "english",
+    "en-",
+    "en_US",
+    "en-US-x",
+    "en\n",
+    "zho-Hant\n",
+    "zho-Hant\n\n",
+    "\u00e9n",
+    "\uff45\uff4e",
+    "x" * 100,
+])
+def test_validate_language_code_matches_re_match(language_code):
+    assert validate_language_code(language_code) == (
+        re_validate_language_code(language_code)
+    )
+
+
+def test_format_srt():
+    transcript = Transcript([
+        Snippet("Hello", 0.0, 1.5),
+        Snippet("World", 3661.25, 2.0),
+    ])
+
+    assert format_transcript_output(transcript, "srt") == (
+        "1\n00:00:00,000 --> 00:00:01,500\nHello\n"
+        "\n"
+        "2\n01:01:01,250 --> 01:01:03,250\nWorld\n"
+    )
+
+
+def test_format_vtt():
+    transcript = Transcript([
+        Snippet("Hello", 0.0, 1.5),
+        Snippet("World", 3661.25, 2.0),
+    ])
+
+    assert format_transcript_output(transcript, "vtt") == (
+        "WEBVTT\n"
+        "\n"
+        "00:00:00.000 --> 00:00:01.500\nHello\n"
+        "\n"
+        "01:01:01.250 --> 01:01:03.250\nWorld\n"
+    )
+
+
+def test_format_text():
+    transcript = Transcript([
+        Snippet("Hello", 0.0, 1.5),
+        Snippet("World", 12.5, 2.0),
+    ])
+
+    assert format_transcript_output(transcript, "text") == (
+        "[0.00s] Hello\n[12.50s] World"
+    )
+
+
+def test_format_json():
+    transcript = Transcript([Snippet("Caf\u00e9", 0.5, 1.5)])
+
+    assert json.loads(format_transcript_output(transcript, "json")) == {
+        "video_id": "dQw4w9WgXcQ",
+        "language": "English",
+        "language_code": "en",
+        "is_generated": False,
+        "transcript": [{"text": "Caf\u00e9", "start": 0.5, "duration": 1.5}],
+    }
+
+
+@pytest.mark.parametrize("format_type", ["json", "text", "srt", "vtt"])
+@pytest.mark.parametrize("count", [0, 1, 5, 300])
+def test_iter_format_matches_format(format_type, count):
+    transcript = make_transcript(count)
+
+    chunks = iter_format_transcript_output(transcript, format_type)
+
+    assert "".join(chunks) == format_transcript_output(transcript, format_type)
+
+
+@pytest.mark.parametrize("format_type, chunks", [
+    ("text", 5),
+    ("srt", 5),
+    ("vtt", 6),
+])
+def test_iter_format_yields_chunk_per_snippet(format_type, chunks):
+    transcript = make_transcript(5)
+
+    assert len(list(iter_format_transcript_output(transcript, format_type))) == chunks
+
+
+def test_format_unsupported():
+    with pytest.raises(ValueError):
+        format_transcript_output(make_transcript(1), "pdf")
+    with pytest.raises(ValueError):
+        iter_format_transcript_output(make_transcript(1), "pdf")
+
+
+def reference_time(seconds, ms_separator):
+    """SRT/WebVTT time as originally formatted, before the HH:MM:SS table."""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    millisecs = int((seconds % 1) * 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{ms_separator}{millisecs:03d}"
+
+
+# Around the end of the HH:MM:SS table (3 hours) and well past it
+TIMES = [0.0, 0.5, 59.75, 3599.5, 3661.25, 10799.5, 10800.0, 10800.25, 36000.125]
+
+
+@pytest.mark.parametrize("seconds", TIMES)
+def test_seconds_to_time(seconds):
+    assert seconds_to_srt_time(seconds) == reference_time(seconds, ",")
+    assert seconds_to_vtt_time(seconds) == reference_time(seconds, ".")
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_long_srt_matches_per_snippet_timestamps(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(utils, "_HAS_NUMPY", use_numpy)
+    # Spans several NumPy batches and runs past the end of the HH:MM:SS table
+    transcript = Transcript([
+        Snippet(f"line {i}", i * 7.25, 1.25 + (i % 4) * 0.25)
+        for i in range(2 * utils._NUMPY_BATCH_SIZE + 10)
+    ])
+
+    expected = "\n".join(
+        f"{i}\n"
+        f"{reference_time(snippet.start, ',')} --> "
+        f"{reference_time(snippet.start + snippet.duration, ',')}\n"
+        f"{snippet.text}\n"
+        for i, snippet in enumerate(transcript.snippets, 1)
+    )
+    assert format_transcript_output(transcript, "srt") == expected